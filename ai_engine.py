@@ -1,7 +1,148 @@
-import random
 import time
 from typing import List, Tuple, Optional, Union, Any
-from game_board import GameBoard
+from game_board import GameBoard, WIN_MASKS, FULL_MASK, ZOBRIST_SIDE, PLAYER_X, PLAYER_O
+
+
+# The center 3x3 region offers more opportunities for winning lines
+CENTER_MASK: int = sum(1 << (row * 9 + col) for row in range(3, 6) for col in range(3, 6))
+
+
+def _window_score(player_count: int, opponent_count: int) -> int:
+    """
+    Score a window of 4 positions from the number of pieces each side has in it.
+
+    Args:
+        player_count (int): Pieces of the AI player in the window
+        opponent_count (int): Pieces of the opponent in the window
+
+    Returns:
+        int: Score for this window
+    """
+    score = 0
+    empty_count = 4 - player_count - opponent_count
+
+    # If both players have pieces in this window, it's not a winning line
+    if player_count > 0 and opponent_count > 0:
+        return 0
+
+    # Prioritize winning moves
+    if player_count == 3 and empty_count == 1:
+        score += 50  # Near win
+    elif player_count == 2 and empty_count == 2:
+        score += 10  # Potential future win
+    elif player_count == 1 and empty_count == 3:
+        score += 1  # Early development
+
+    # Block opponent's winning moves
+    if opponent_count == 3 and empty_count == 1:
+        score -= 40  # Block opponent's near win
+    elif opponent_count == 2 and empty_count == 2:
+        score -= 8  # Block opponent's developing threat
+
+    return score
+
+
+# Window scores for every (player_count, opponent_count) pair, built once from _window_score.
+# Only pairs with player_count + opponent_count <= 4 can occur; the rest are never read.
+WINDOW_SCORE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_window_score(player_count, opponent_count) for opponent_count in range(5))
+    for player_count in range(5)
+)
+
+
+def _line_score(player_bits: int, opponent_bits: int) -> int:
+    """
+    Sum the window scores of every possible winning line.
+
+    This is the leaf-node hot path of the search, so it works on the raw
+    bitboards and scores each window with a single table lookup.
+
+    Args:
+        player_bits (int): Bitboard of the AI player
+        opponent_bits (int): Bitboard of the opponent
+
+    Returns:
+        int: Score based on line analysis
+    """
+    score = 0
+    for mask in WIN_MASKS:
+        score += WINDOW_SCORE[(player_bits & mask).bit_count()][(opponent_bits & mask).bit_count()]
+    return score
+
+
+# Score given to a completed line in the fused leaf table. It dwarfs any heuristic total
+# (at most 180 windows * 50 + center bonus), so a win survives summation and is read off the sign.
+COMPLETED_LINE: int = 100_000
+
+# WINDOW_SCORE extended so a full window of either side marks the position as won
+LEAF_WINDOW_SCORE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        COMPLETED_LINE if player_count == 4 else -COMPLETED_LINE if opponent_count == 4
+        else WINDOW_SCORE[player_count][opponent_count]
+        for opponent_count in range(5)
+    )
+    for player_count in range(5)
+)
+
+
+def _center_score(player_bits: int, opponent_bits: int) -> int:
+    """
+    Score control of the center 3x3 region.
+
+    Args:
+        player_bits (int): Bitboard of the AI player
+        opponent_bits (int): Bitboard of the opponent
+
+    Returns:
+        int: 3 points per center position held by the AI, minus 3 per opponent position
+    """
+    return 3 * ((player_bits & CENTER_MASK).bit_count() - (opponent_bits & CENTER_MASK).bit_count())
+
+
+def _leaf_score(player_bits: int, opponent_bits: int) -> int:
+    """
+    Score a leaf position and detect a completed line in a single pass.
+
+    Equivalent to the line score plus the center score for positions that
+    are not won. A won position scores at least COMPLETED_LINE // 2 (AI win)
+    or at most -COMPLETED_LINE // 2 (opponent win).
+
+    Args:
+        player_bits (int): Bitboard of the AI player
+        opponent_bits (int): Bitboard of the opponent
+
+    Returns:
+        int: Heuristic score, or a value beyond +/- COMPLETED_LINE // 2 for a win
+    """
+    score = _center_score(player_bits, opponent_bits)
+    for mask in WIN_MASKS:
+        score += LEAF_WINDOW_SCORE[(player_bits & mask).bit_count()][(opponent_bits & mask).bit_count()]
+    return score
+
+
+# Cells ordered by Manhattan distance from the center (4,4), computed once for move ordering.
+# Each entry pairs the cell's bit with its (row, col) so occupancy is tested with a single AND.
+CENTER_ORDER: Tuple[Tuple[int, Tuple[int, int]], ...] = tuple(
+    (1 << (row * 9 + col), (row, col))
+    for row, col in sorted(((row, col) for row in range(9) for col in range(9)),
+                           key=lambda pos: abs(pos[0] - 4) + abs(pos[1] - 4))
+)
+
+# Integer bounds for alpha-beta; far outside any reachable score, and avoid int/float mixing
+INF: int = 1_000_000_000
+
+# Number of killer moves remembered per ply
+KILLER_SLOTS = 2
+
+# Transposition table size; a power of two so a slot is the low bits of the hash
+TT_SIZE: int = 1 << 20
+TT_MASK: int = TT_SIZE - 1
+
+# Transposition table entry flags: how a stored value relates to the true minimax value
+EXACT = 0
+LOWER_BOUND = 1  # Search failed high; the true value is at least the stored value
+UPPER_BOUND = 2  # Search failed low; the true value is at most the stored value
+
 
 class AIEngine:
     """
@@ -9,7 +150,7 @@ class AIEngine:
     Combines minimax with alpha-beta pruning and a custom heuristic function.
     """
 
-    def __init__(self, depth_limit: int = 3) -> None:
+    def __init__(self, depth_limit: int = 3, time_limit: Optional[float] = None) -> None:
         """
         Initialize the AI engine with a specified depth limit.
 
@@ -26,14 +167,30 @@ class AIEngine:
 
         Args:
             depth_limit (int): Maximum depth for the alpha-beta search
+            time_limit (float, optional): Seconds after which no deeper iteration is started
         """
         self.depth_limit = depth_limit
+        self.time_limit = time_limit
         self.player_symbol = None
         self.opponent_symbol = None
 
+        # Transposition table: fixed-size slots of (key, depth, value, flag, best_move, generation),
+        # where key is the Zobrist hash with the side to move folded in. Positions reached through
+        # different move orders are only searched once, and entries are kept between turns.
+        # The slots are allocated by the first search, once the player is known.
+        self.transposition_table: List[Optional[tuple]] = []
+        self.generation = 0  # Incremented per search so entries from earlier turns can be replaced
+
+        # Killer moves: per ply, the most recent quiet moves that caused a cut-off
+        self.killer_moves: List[List[Tuple[int, int]]] = []
+
     def get_best_move(self, board: GameBoard, player_symbol: str) -> Tuple[int, int]:
         """
-        Find the best move using alpha-beta search.
+        Find the best move using iterative deepening alpha-beta search.
+
+        The board is searched to depth 1, 2, ... up to the depth limit. Each
+        shallow pass fills the transposition table and killer moves, so the
+        deeper passes try the most promising moves first and prune more.
 
         Args:
             board: The current game board
@@ -42,28 +199,69 @@ class AIEngine:
         Returns:
             tuple: (row, col) of the best move
         """
-        self.player_symbol = player_symbol
-        self.opponent_symbol = 'O' if player_symbol == 'X' else 'X'
+        self._prepare_search(player_symbol)
+
+        # Search on a private copy; moves are made and unmade in place from here on
+        board = board.get_board_copy()
+        start_time = time.monotonic()
 
-        # Start alpha-beta search
-        best_score = float('-inf')
         best_move = None
-        alpha = float('-inf')
-        beta = float('inf')
+        for depth in range(1, self.depth_limit + 1):
+            best_move = self._root_search(board, depth, best_move)
+
+            # Anytime behaviour: keep the last completed iteration once the budget is spent
+            if self.time_limit is not None and time.monotonic() - start_time >= self.time_limit:
+                break
+
+        # Every iteration returns one of the empty positions; the board is never full here
+        assert best_move is not None
+        return best_move
+
+    def _prepare_search(self, player_symbol: str) -> None:
+        """
+        Set up the per-search state for the given player.
+
+        Args:
+            player_symbol (str): Symbol of the player the search maximizes for
+        """
+        if player_symbol != self.player_symbol:
+            # Stored scores are from the previous player's point of view
+            self.transposition_table = [None] * TT_SIZE
+        self.generation += 1
+        self.player_symbol = player_symbol
+        self.opponent_symbol = PLAYER_O if player_symbol == PLAYER_X else PLAYER_X
+        self.killer_moves = [[] for _ in range(self.depth_limit + 1)]
+
+    def _root_search(self, board: GameBoard, depth: int,
+                     previous_best: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Run one alpha-beta pass over every move at the root.
 
-        empty_positions = board.get_empty_positions()
+        Args:
+            board: The current game board
+            depth (int): Depth of this iteration
+            previous_best: Best move of the previous iteration, searched first
 
-        # Sort moves to try center positions first (typically stronger in Tic-Tac-Toe)
+        Returns:
+            tuple: (row, col) of the best move at this depth
+        """
+        # Try center positions first (typically stronger in Tic-Tac-Toe), after the previous best move
         # This improves alpha-beta pruning efficiency
-        empty_positions.sort(key=lambda pos: -self._position_value(pos))
+        empty_positions = self._order_moves(board, previous_best, 0)
+
+        # Start alpha-beta search
+        best_score = -INF
+        best_move = empty_positions[0]
+        alpha = -INF
+        beta = INF
 
         for row, col in empty_positions:
             # Try this move
-            board_copy = board.get_board_copy()
-            board_copy.board[row][col] = player_symbol  # Direct assignment for evaluation only
+            board.make_move(row, col, self.player_symbol)
 
             # Evaluate this move using h-minimax with alpha-beta pruning
-            score = self.minimax(board_copy, self.depth_limit - 1, False, alpha, beta)
+            score = self.minimax(board, depth - 1, False, alpha, beta, ply=1, last_move=(row, col))
+            board.undo_move(row, col, self.player_symbol)
 
             # Update best move if needed
             if score > best_score:
@@ -72,26 +270,53 @@ class AIEngine:
 
             alpha = max(alpha, best_score)
 
-        # If no good move found (should not happen), pick a random one
-        return best_move if best_move else random.choice(empty_positions)
+        return best_move
 
-    def _position_value(self, pos: Tuple[int, int]) -> int:
+    def _order_moves(self, board: GameBoard, tt_move: Optional[Tuple[int, int]], ply: int) -> List[Tuple[int, int]]:
         """
-        Helper function to value positions for move ordering.
-        Center positions are more valuable in Tic-Tac-Toe.
+        List the empty positions in the order they should be searched.
+
+        The transposition table move is tried first, then the killer moves of
+        this ply, then the remaining cells from the center outwards. Good
+        ordering lets alpha-beta cut off most of the remaining siblings.
 
         Args:
-            pos: (row, col) tuple
+            board: The current game board
+            tt_move: Best move stored for this position, if any
+            ply (int): Distance from the root of the search
 
         Returns:
-            int: Position value for sorting
+            list: (row, col) tuples of every empty position
         """
-        row, col = pos
-        # Distance from center (4,4) - lower is better
-        center_distance = abs(row - 4) + abs(col - 4)
-        return -center_distance
+        # Bitmask of the empty cells; moves placed in front are cleared from it as they are taken
+        empty = ~(board.bb_x | board.bb_o) & FULL_MASK
+        first = []
+        if tt_move is not None:
+            first.append(tt_move)
+            empty &= ~(1 << (tt_move[0] * 9 + tt_move[1]))
+        for killer in self.killer_moves[ply]:
+            bit = 1 << (killer[0] * 9 + killer[1])
+            if empty & bit:
+                first.append(killer)
+                empty ^= bit
+
+        return first + [move for bit, move in CENTER_ORDER if empty & bit]
+
+    def _store_killer(self, move: Tuple[int, int], ply: int) -> None:
+        """
+        Remember a move that caused a cut-off at the given ply.
 
-    def minimax(self, board: GameBoard, depth: int, is_maximizing: bool, alpha: float, beta: float) -> float:
+        Args:
+            move: (row, col) of the move
+            ply (int): Distance from the root of the search
+        """
+        killers = self.killer_moves[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLER_SLOTS:]
+
+    def minimax(self, board: GameBoard, depth: int, is_maximizing: bool, alpha: int, beta: int,
+                ply: int = 0, last_move: Optional[Tuple[int, int]] = None) -> int:
         """
         Minimax algorithm with alpha-beta pruning and heuristic evaluation.
 
@@ -99,52 +324,130 @@ class AIEngine:
             board: The current game board
             depth (int): Current depth in the search tree
             is_maximizing (bool): True if maximizing player's turn, False for minimizing
-            alpha (float): Alpha value for pruning
-            beta (float): Beta value for pruning
+            alpha (int): Alpha value for pruning
+            beta (int): Beta value for pruning
+            ply (int): Distance from the root, used to index killer moves
+            last_move: (row, col) of the move that led here; when given, only the
+                side that just moved can have won and only through that cell
 
         Returns:
-            float: The score of the best move
+            int: The score of the best move
         """
-        # Terminal conditions
-        if board.check_win(self.player_symbol):
-            return 1000 + depth  # Win for AI (prefer quick wins)
-
-        if board.check_win(self.opponent_symbol):
-            return -1000 - depth  # Win for opponent (prefer delaying losses)
-
-        if board.is_full():
-            return 0  # Draw
+        alpha_original = alpha
+        beta_original = beta
+
+        # Probe the transposition table for a result from an earlier visit
+        key = board.zhash ^ ZOBRIST_SIDE if is_maximizing else board.zhash
+        entry = self.transposition_table[key & TT_MASK]
+        tt_move = None
+        if entry is not None and entry[0] == key:
+            _, entry_depth, entry_value, entry_flag, tt_move, _ = entry
+            if entry_depth >= depth:
+                if entry_flag == EXACT:
+                    return entry_value
+                if entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if beta <= alpha:
+                    return entry_value
 
         if depth == 0:
-            return self.evaluate_board(board)  # Heuristic evaluation at leaf nodes
+            # Leaf: one pass over every window both scores the position and detects a win
+            value = _leaf_score(board.get_bitboard(self.player_symbol), board.get_bitboard(self.opponent_symbol))
+            if value >= COMPLETED_LINE // 2:
+                value = 1000 + depth  # Win for AI
+            elif value <= -COMPLETED_LINE // 2:
+                value = -1000 - depth  # Win for opponent
+            elif board.is_full():
+                value = 0  # Draw
+            self._store_entry(key, depth, value, EXACT, None)
+            return value
+
+        # Terminal conditions
+        if last_move is None:
+            player_won = board.check_win(self.player_symbol)
+            opponent_won = not player_won and board.check_win(self.opponent_symbol)
+        elif is_maximizing:
+            player_won = False
+            opponent_won = board.check_win_at(last_move[0], last_move[1], self.opponent_symbol)
+        else:
+            player_won = board.check_win_at(last_move[0], last_move[1], self.player_symbol)
+            opponent_won = False
+
+        if player_won:
+            value = 1000 + depth  # Win for AI (prefer quick wins)
+        elif opponent_won:
+            value = -1000 - depth  # Win for opponent (prefer delaying losses)
+        elif board.is_full():
+            value = 0  # Draw
+        else:
+            value = None
 
-        empty_positions = board.get_empty_positions()
+        if value is not None:
+            self._store_entry(key, depth, value, EXACT, None)
+            return value
 
-        # Sort moves for better pruning
-        empty_positions.sort(key=lambda pos: -self._position_value(pos))
+        empty_positions = self._order_moves(board, tt_move, ply)
 
+        best_move = None
         if is_maximizing:
-            max_eval = float('-inf')
+            value = -INF
             for row, col in empty_positions:
-                board_copy = board.get_board_copy()
-                board_copy.board[row][col] = self.player_symbol  # Direct assignment for evaluation only
-                eval_score = self.minimax(board_copy, depth - 1, False, alpha, beta)
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, max_eval)
+                board.make_move(row, col, self.player_symbol)
+                eval_score = self.minimax(board, depth - 1, False, alpha, beta, ply + 1, (row, col))
+                board.undo_move(row, col, self.player_symbol)
+                if eval_score > value:
+                    value = eval_score
+                    best_move = (row, col)
+                alpha = max(alpha, value)
                 if beta <= alpha:
+                    self._store_killer((row, col), ply)
                     break  # Beta cut-off
-            return max_eval
         else:
-            min_eval = float('inf')
+            value = INF
             for row, col in empty_positions:
-                board_copy = board.get_board_copy()
-                board_copy.board[row][col] = self.opponent_symbol  # Direct assignment for evaluation only
-                eval_score = self.minimax(board_copy, depth - 1, True, alpha, beta)
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, min_eval)
+                board.make_move(row, col, self.opponent_symbol)
+                eval_score = self.minimax(board, depth - 1, True, alpha, beta, ply + 1, (row, col))
+                board.undo_move(row, col, self.opponent_symbol)
+                if eval_score < value:
+                    value = eval_score
+                    best_move = (row, col)
+                beta = min(beta, value)
                 if beta <= alpha:
+                    self._store_killer((row, col), ply)
                     break  # Alpha cut-off
-            return min_eval
+
+        # Record whether the value is exact or only a bound of the true value
+        if value <= alpha_original:
+            flag = UPPER_BOUND
+        elif value >= beta_original:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._store_entry(key, depth, value, flag, best_move)
+        return value
+
+    def _store_entry(self, key: int, depth: int, value: int, flag: int,
+                     best_move: Optional[Tuple[int, int]]) -> None:
+        """
+        Save a search result in the transposition table.
+
+        A slot holding a different position is only overwritten when the new
+        result is at least as deep or the old one is from an earlier search,
+        so expensive deep results are not evicted by cheap leaf entries.
+
+        Args:
+            key (int): Zobrist hash of the position including the side to move
+            depth (int): Remaining depth the value was searched to
+            value (int): Score found for the position
+            flag (int): EXACT, LOWER_BOUND or UPPER_BOUND
+            best_move: Best move found at the position, if any
+        """
+        slot = key & TT_MASK
+        old = self.transposition_table[slot]
+        if old is None or old[0] == key or depth >= old[1] or old[5] != self.generation:
+            self.transposition_table[slot] = (key, depth, value, flag, best_move, self.generation)
 
     def evaluate_board(self, board: GameBoard) -> int:
         """
@@ -174,15 +477,8 @@ class AIEngine:
         score += self.evaluate_lines(board)
 
         # Consider center control
-        # The center 3x3 region offers more opportunities for winning lines
-        center_region = [(3, 3), (3, 4), (3, 5),
-                         (4, 3), (4, 4), (4, 5),
-                         (5, 3), (5, 4), (5, 5)]
-        for row, col in center_region:
-            if board.board[row][col] == self.player_symbol:
-                score += 3  # Bonus for controlling center positions
-            elif board.board[row][col] == self.opponent_symbol:
-                score -= 3  # Penalty for opponent controlling center
+        # Bonus for each center position we control, penalty for each the opponent controls
+        score += _center_score(board.get_bitboard(self.player_symbol), board.get_bitboard(self.opponent_symbol))
 
         return score
 
@@ -196,66 +492,23 @@ class AIEngine:
         Returns:
             int: Score based on line analysis
         """
-        score = 0
-        win_length = 4  # Length needed to win
-
-        # Check rows
-        for row in range(9):
-            for col in range(9 - win_length + 1):
-                window = [board.board[row][col + i] for i in range(win_length)]
-                score += self.evaluate_window(window)
-
-        # Check columns
-        for col in range(9):
-            for row in range(9 - win_length + 1):
-                window = [board.board[row + i][col] for i in range(win_length)]
-                score += self.evaluate_window(window)
-
-        # Check diagonals (top-left to bottom-right)
-        for row in range(9 - win_length + 1):
-            for col in range(9 - win_length + 1):
-                window = [board.board[row + i][col + i] for i in range(win_length)]
-                score += self.evaluate_window(window)
-
-        # Check diagonals (top-right to bottom-left)
-        for row in range(9 - win_length + 1):
-            for col in range(win_length - 1, 9):
-                window = [board.board[row + i][col - i] for i in range(win_length)]
-                score += self.evaluate_window(window)
-
-        return score
+        player_bits = board.get_bitboard(self.player_symbol)
+        opponent_bits = board.get_bitboard(self.opponent_symbol)
+        return _line_score(player_bits, opponent_bits)
 
-    def evaluate_window(self, window: List[str]) -> int:
+    def evaluate_window(self, player_bits: int, opponent_bits: int, mask: int) -> int:
         """
         Evaluate a window of 4 positions.
 
         Args:
-            window (list): List of 4 board positions
+            player_bits (int): Bitboard of the AI player
+            opponent_bits (int): Bitboard of the opponent
+            mask (int): Bitmask selecting the 4 positions of the window
 
         Returns:
             int: Score for this window
         """
-        score = 0
-        player_count = window.count(self.player_symbol)
-        opponent_count = window.count(self.opponent_symbol)
-        empty_count = window.count(' ')
-
-        # If both players have pieces in this window, it's not a winning line
-        if player_count > 0 and opponent_count > 0:
-            return 0
-
-        # Prioritize winning moves
-        if player_count == 3 and empty_count == 1:
-            score += 50  # Near win
-        elif player_count == 2 and empty_count == 2:
-            score += 10  # Potential future win
-        elif player_count == 1 and empty_count == 3:
-            score += 1  # Early development
-
-        # Block opponent's winning moves
-        if opponent_count == 3 and empty_count == 1:
-            score -= 40  # Block opponent's near win
-        elif opponent_count == 2 and empty_count == 2:
-            score -= 8  # Block opponent's developing threat
-
-        return score
\ No newline at end of file
+        player_count = (player_bits & mask).bit_count()
+        opponent_count = (opponent_bits & mask).bit_count()
+        return WINDOW_SCORE[player_count][opponent_count]
+
@@ -1,18 +1,109 @@
+import random
 from typing import List, Tuple, Optional
 
 
+BOARD_SIZE: int = 9
+WIN_LENGTH: int = 4  # Number of consecutive pieces needed to win
+FULL_MASK: int = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1  # One bit per cell, all set
+
+# Cell symbols shared by every module, so the same interned strings are compared everywhere
+PLAYER_X: str = 'X'
+PLAYER_O: str = 'O'
+EMPTY: str = ' '
+
+
+# Directions a line of pieces can run in: horizontal, vertical and the two diagonals
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# Every window of WIN_LENGTH cells that can form a win, as a tuple of (row, col) positions.
+# Built once at import so no caller has to re-walk the board with nested loops.
+WIN_LINES: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    tuple((row + d_row * i, col + d_col * i) for i in range(WIN_LENGTH))
+    for d_row, d_col in DIRECTIONS
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+    if 0 <= row + d_row * (WIN_LENGTH - 1) < BOARD_SIZE and 0 <= col + d_col * (WIN_LENGTH - 1) < BOARD_SIZE
+)
+
+# The same windows as bitmasks; bit (row * 9 + col) represents cell (row, col)
+WIN_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << (row * BOARD_SIZE + col) for row, col in line) for line in WIN_LINES
+)
+
+# Shift-and-AND win detection: for each direction, the bit distance between neighbouring
+# cells and the mask of cells a full line may start from. Shifting a bitboard by 0, 1, 2 and
+# 3 steps and ANDing leaves a bit set exactly where a line of 4 starts; the start mask stops
+# lines from wrapping across row edges.
+WIN_SHIFTS: Tuple[Tuple[int, int], ...] = tuple(
+    (d_row * BOARD_SIZE + d_col,
+     sum(1 << (row * BOARD_SIZE + col)
+         for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+         if 0 <= row + d_row * (WIN_LENGTH - 1) < BOARD_SIZE
+         and 0 <= col + d_col * (WIN_LENGTH - 1) < BOARD_SIZE))
+    for d_row, d_col in DIRECTIONS
+)
+
+# For every cell index (row * 9 + col), the masks of the windows that contain that cell.
+# A new piece can only complete one of these, at most 16 instead of all 180.
+MASKS_THROUGH: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(mask for mask in WIN_MASKS if mask >> index & 1)
+    for index in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+# Zobrist keys: one random 64-bit value per (cell, symbol), indexed [row * 9 + col][0 for 'X', 1 for 'O'].
+# A fixed seed keeps hashes reproducible between runs.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST: Tuple[Tuple[int, int], ...] = tuple(
+    (_zobrist_rng.getrandbits(64), _zobrist_rng.getrandbits(64))
+    for _ in range(BOARD_SIZE * BOARD_SIZE)
+)
+# XORed into a hash to tell apart the same position with the other side to move
+ZOBRIST_SIDE: int = _zobrist_rng.getrandbits(64)
+
+
 class GameBoard:
     """
     Class representing the 9x9 Tic-Tac-Toe game board.
     Handles board state management and win condition checking.
+
+    The state is stored as two bitboards, one 81-bit integer per player, where
+    bit (row * 9 + col) is set when that player occupies the cell. Win checks
+    and line scoring then reduce to a few integer operations per window.
     """
 
     def __init__(self) -> None:
         """Initialize an empty 9x9 board."""
-        self.board: List[List[str]] = [[' ' for _ in range(9)] for _ in range(9)]
-        self.size: int = 9
-        self.win_length: int = 4  # Number of consecutive pieces needed to win
+        self.bb_x: int = 0  # Cells occupied by 'X'
+        self.bb_o: int = 0  # Cells occupied by 'O'
+        self.size: int = BOARD_SIZE
+        self.win_length: int = WIN_LENGTH
         self.last_move: Optional[Tuple[int, int]] = None  # Track last move for highlighting
+        self.zhash: int = 0  # Zobrist hash of the position, updated incrementally
+
+    @property
+    def board(self) -> List[List[str]]:
+        """
+        Build a 2D list view of the board for display purposes.
+
+        Returns:
+            list: Rows of cell symbols (' ', 'X' or 'O')
+        """
+        bb_x = self.bb_x
+        bb_o = self.bb_o
+        rows = []
+        bit = 1
+        for _ in range(self.size):
+            cells = []
+            for _ in range(self.size):
+                if bb_x & bit:
+                    cells.append(PLAYER_X)
+                elif bb_o & bit:
+                    cells.append(PLAYER_O)
+                else:
+                    cells.append(EMPTY)
+                bit <<= 1
+            rows.append(cells)
+        return rows
 
     def make_move(self, row: int, col: int, symbol: str) -> bool:
         """
@@ -26,14 +117,58 @@ class GameBoard:
         Returns:
             bool: True if move was successful, False if position is already taken
         """
-        if 0 <= row < self.size and 0 <= col < self.size and self.board[row][col] == ' ':
-            # Store last move for highlighting
-            self.last_move = (row, col)
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return False
+
+        index = row * self.size + col
+        bit = 1 << index
+        if (self.bb_x | self.bb_o) & bit:
+            return False
+
+        # Store last move for highlighting
+        self.last_move = (row, col)
+
+        # Set the position on the board
+        if symbol == PLAYER_X:
+            self.bb_x |= bit
+            self.zhash ^= ZOBRIST[index][0]
+        else:
+            self.bb_o |= bit
+            self.zhash ^= ZOBRIST[index][1]
+        return True
+
+    def undo_move(self, row: int, col: int, symbol: str) -> None:
+        """
+        Remove a symbol previously placed with make_move.
 
-            # Set the position on the board
-            self.board[row][col] = symbol
-            return True
-        return False
+        Used by the AI search to unmake moves in place instead of copying the
+        board at every node. The last move highlight is left unchanged.
+
+        Args:
+            row (int): Row index (0-8)
+            col (int): Column index (0-8)
+            symbol (str): Player symbol ('X' or 'O') that occupies the cell
+        """
+        index = row * self.size + col
+        bit = 1 << index
+        if symbol == PLAYER_X:
+            self.bb_x ^= bit
+            self.zhash ^= ZOBRIST[index][0]
+        else:
+            self.bb_o ^= bit
+            self.zhash ^= ZOBRIST[index][1]
+
+    def get_bitboard(self, symbol: str) -> int:
+        """
+        Return the bitboard of the given player.
+
+        Args:
+            symbol (str): Player symbol ('X' or 'O')
+
+        Returns:
+            int: Bitmask of the cells occupied by that player
+        """
+        return self.bb_x if symbol == PLAYER_X else self.bb_o
 
     def check_win(self, symbol: str) -> bool:
         """
@@ -45,30 +180,33 @@ class GameBoard:
         Returns:
             bool: True if the player has won, False otherwise
         """
-        # Check horizontally
-        for row in range(self.size):
-            for col in range(self.size - self.win_length + 1):
-                if all(self.board[row][col + i] == symbol for i in range(self.win_length)):
-                    return True
-
-        # Check vertically
-        for row in range(self.size - self.win_length + 1):
-            for col in range(self.size):
-                if all(self.board[row + i][col] == symbol for i in range(self.win_length)):
-                    return True
-
-        # Check diagonally (top-left to bottom-right)
-        for row in range(self.size - self.win_length + 1):
-            for col in range(self.size - self.win_length + 1):
-                if all(self.board[row + i][col + i] == symbol for i in range(self.win_length)):
-                    return True
-
-        # Check diagonally (top-right to bottom-left)
-        for row in range(self.size - self.win_length + 1):
-            for col in range(self.win_length - 1, self.size):
-                if all(self.board[row + i][col - i] == symbol for i in range(self.win_length)):
-                    return True
+        bb = self.get_bitboard(symbol)
+
+        # Each direction tests all 81 cells at once; stop at the first direction with a line
+        for shift, start_mask in WIN_SHIFTS:
+            if bb & (bb >> shift) & (bb >> 2 * shift) & (bb >> 3 * shift) & start_mask:
+                return True
+        return False
+
+    def check_win_at(self, row: int, col: int, symbol: str) -> bool:
+        """
+        Check if the piece at (row, col) completes 4 in a row for the specified symbol.
+
+        Only the windows passing through that cell are examined, which is enough
+        to detect a win created by the most recent move.
+
+        Args:
+            row (int): Row index (0-8) of the last move
+            col (int): Column index (0-8) of the last move
+            symbol (str): Player symbol to check for win
 
+        Returns:
+            bool: True if the player has won through that cell, False otherwise
+        """
+        bb = self.get_bitboard(symbol)
+        for mask in MASKS_THROUGH[row * self.size + col]:
+            if bb & mask == mask:
+                return True
         return False
 
     def is_full(self) -> bool:
@@ -78,7 +216,7 @@ class GameBoard:
         Returns:
             bool: True if all positions are filled, False otherwise
         """
-        return all(self.board[row][col] != ' ' for row in range(self.size) for col in range(self.size))
+        return (self.bb_x | self.bb_o) == FULL_MASK
 
     def get_empty_positions(self) -> List[Tuple[int, int]]:
         """
@@ -87,7 +225,14 @@ class GameBoard:
         Returns:
             list: List of (row, col) tuples representing empty positions
         """
-        return [(row, col) for row in range(self.size) for col in range(self.size) if self.board[row][col] == ' ']
+        positions = []
+        empty = ~(self.bb_x | self.bb_o) & FULL_MASK
+        while empty:
+            lowest = empty & -empty
+            index = lowest.bit_length() - 1
+            positions.append(divmod(index, self.size))
+            empty ^= lowest
+        return positions
 
     def get_board_copy(self) -> "GameBoard":
         """
@@ -97,8 +242,8 @@ class GameBoard:
             GameBoard: A new GameBoard object with the same state
         """
         board_copy = GameBoard()
-        for row in range(self.size):
-            for col in range(self.size):
-                board_copy.board[row][col] = self.board[row][col]
+        board_copy.bb_x = self.bb_x
+        board_copy.bb_o = self.bb_o
         board_copy.last_move = self.last_move
-        return board_copy
\ No newline at end of file
+        board_copy.zhash = self.zhash
+        return board_copy
@@ -1,6 +1,7 @@
+import argparse
 import time
-from typing import Union, Tuple, Optional
-from game_board import GameBoard
+from typing import List, Union, Tuple, Optional
+from game_board import GameBoard, PLAYER_X, PLAYER_O
 from player import HumanPlayer, ComputerPlayer
 from ai_engine import AIEngine
 from ui import GameUI
@@ -12,18 +13,29 @@ class GameController:
     Handles the main game loop, player turns, and game state.
     """
 
-    def __init__(self) -> None:
-        """Initialize the game controller and components."""
+    def __init__(self, animations: bool = True) -> None:
+        """
+        Initialize the game controller and components.
+
+        Args:
+            animations (bool): Whether the UI plays its animations
+        """
         self.board: GameBoard = GameBoard()
         self.ai_engine: AIEngine = AIEngine(depth_limit=3)  # Depth limit explained in AIEngine class
-        self.human_player: HumanPlayer = HumanPlayer('X')
-        self.computer_player: ComputerPlayer = ComputerPlayer('O', self.ai_engine)
-        self.current_player: Union[HumanPlayer, ComputerPlayer] = self.human_player  # Human goes first
-        self.ui = GameUI()
+        self.human_player: HumanPlayer = HumanPlayer(PLAYER_X)
+        self.computer_player: ComputerPlayer = ComputerPlayer(PLAYER_O, self.ai_engine)
+        self._players: Tuple[HumanPlayer, ComputerPlayer] = (self.human_player, self.computer_player)
+        self._turn: int = 0  # Index into _players of the player to move; human goes first
+        self.ui = GameUI(animations)
+
+    @property
+    def current_player(self) -> Union[HumanPlayer, ComputerPlayer]:
+        """The player whose turn it is."""
+        return self._players[self._turn]
 
     def switch_player(self) -> None:
         """Switch to the other player."""
-        self.current_player = self.computer_player if self.current_player == self.human_player else self.human_player
+        self._turn ^= 1
 
     def get_human_move(self) -> Tuple[int, int]:
         """
@@ -36,10 +48,8 @@ class GameController:
             # Get input coordinates from UI
             row, col = self.ui.prompt_for_move()
 
-            # Validate the move
-            if self.board.board[row][col] == ' ':
-                # Valid move
-                self.board.make_move(row, col, self.human_player.symbol)
+            # make_move validates the position and only places the symbol if it is free
+            if self.board.make_move(row, col, self.human_player.symbol):
                 # Animate the move
                 self.ui.animate_move(self.board.board, row, col, self.human_player.symbol)
                 return row, col
@@ -53,11 +63,9 @@ class GameController:
         Returns:
             tuple: (row, col) coordinates of the computer's move
         """
-        # Show thinking animation
-        self.ui.display_computer_thinking()
-
-        # Get the best move from AI engine
-        row, col = self.computer_player.get_move(self.board)
+        # Get the best move from AI engine, showing the thinking animation while it searches
+        with self.ui.display_computer_thinking():
+            row, col = self.computer_player.get_move(self.board)
 
         # Make the move
         self.board.make_move(row, col, self.computer_player.symbol)
@@ -70,18 +78,39 @@ class GameController:
 
         return row, col
 
+    def _reset_for_new_game(self) -> None:
+        """
+        Prepare a fresh board for another game.
+
+        The AI engine is kept, so its transposition table carries over from one
+        game to the next.
+        """
+        self.board = GameBoard()
+        self._turn = 0  # Human goes first
+
     def play_game(self) -> None:
         """
         Main game loop.
+        Plays games until the user declines to play again.
+        """
+        while True:
+            self._play_one_game()
+
+            # Ask to play again
+            if not self.ui.prompt_play_again():
+                break
+            self._reset_for_new_game()
+
+    def _play_one_game(self) -> None:
+        """
+        Play a single game.
         Controls the flow of the game, including turns, win checking, and game end.
         """
         self.ui.display_welcome()
         game_over: bool = False
 
         while not game_over:
-            self.ui.clear_screen()
-            self.ui.display_game_status(self.current_player.symbol)
-            self.ui.display_board(self.board.board, self.board.last_move)
+            self.ui.display_turn(self.current_player.symbol, self.board.board, self.board.last_move)
 
             # Get the move from the current player
             if self.current_player == self.human_player:
@@ -89,8 +118,8 @@ class GameController:
             else:
                 row, col = self.get_computer_move()
 
-            # Check for win
-            if self.board.check_win(self.current_player.symbol):
+            # Check for win; only lines through the new piece can have been completed
+            if self.board.check_win_at(row, col, self.current_player.symbol):
                 self.ui.clear_screen()
                 self.ui.display_board(self.board.board, (row, col))
 
@@ -111,10 +140,21 @@ class GameController:
             # Switch to the other player
             self.switch_player()
 
-        # Ask to play again
-        if self.ui.prompt_play_again():
-            self.__init__()  # Reset the game
-            self.play_game()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line options.
+
+    Args:
+        argv: Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="9x9 Tic-Tac-Toe with heuristic alpha-beta search")
+    parser.add_argument("--fast", action="store_true",
+                        help="skip the welcome, move and result animations")
+    return parser.parse_args(argv)
 
 
 def main() -> None:
@@ -122,7 +162,8 @@ def main() -> None:
     Entry point for the application.
     Creates and starts the game controller.
     """
-    game: GameController = GameController()
+    args = parse_args()
+    game: GameController = GameController(animations=not args.fast)
     game.play_game()
 
 
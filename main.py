@@ -1,5 +1,6 @@
-from game_controller import GameController
+from game_controller import GameController, parse_args
 
 if __name__ == "__main__":
-    game: GameController = GameController()
+    args = parse_args()
+    game: GameController = GameController(animations=not args.fast)
     game.play_game()
\ No newline at end of file
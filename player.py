@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
-from game_board import GameBoard
+from game_board import GameBoard, PLAYER_X, PLAYER_O
 from ai_engine import AIEngine
 
 
@@ -10,6 +10,8 @@ class Player(ABC):
     Defines common interface for human and computer players.
     """
 
+    __slots__ = ('symbol',)
+
     def __init__(self, symbol: str) -> None:
         """
         Initialize a player with their game symbol.
@@ -34,12 +36,14 @@ class Player(ABC):
 
     def get_opponent_symbol(self) -> str:
         """Get the opponent's symbol."""
-        return 'O' if self.symbol == 'X' else 'X'
+        return PLAYER_O if self.symbol == PLAYER_X else PLAYER_X
 
 
 class HumanPlayer(Player):
     """Human player that gets moves from user input."""
 
+    __slots__ = ()
+
     def get_move(self, board: GameBoard) -> Tuple[int, int]:
         """
         Placeholder method for getting a human move.
@@ -59,6 +63,8 @@ class HumanPlayer(Player):
 class ComputerPlayer(Player):
     """Computer player that uses AI to determine moves."""
 
+    __slots__ = ('ai_engine',)
+
     def __init__(self, symbol: str, ai_engine: AIEngine) -> None:
         """
         Initialize computer player with symbol and AI engine.
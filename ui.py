@@ -1,6 +1,8 @@
 import os
+import re
 import time
-from typing import List, Tuple, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple, Optional
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
@@ -10,6 +12,31 @@ from rich.padding import Padding
 from rich.live import Live
 from rich.console import Group
 from rich.align import Align
+from rich.styled import Styled
+from rich.control import Control
+from game_board import PLAYER_X, PLAYER_O, EMPTY
+
+
+# Board cell styles and the marker drawn in empty cells
+X_CELL_STYLE = "bold white on red"
+O_CELL_STYLE = "bold white on blue"
+HIGHLIGHT_STYLE = "bold white on green"  # Last move
+# Empty cell styles indexed by square parity (row ^ col) & 1, alternating like a checkerboard
+EMPTY_CELL_STYLES: Tuple[str, str] = ("dim white on grey23", "dim white on grey15")
+EMPTY_CELL = " · "
+
+# Shortest time in seconds the thinking spinner stays up, so fast searches remain visible
+MIN_THINKING_TIME = 0.3
+
+# Title frames cycled by the win announcement; the last one is left on screen
+WIN_FRAMES: Tuple[str, ...] = (
+    "🎮 GAME OVER 🎮",
+    "✨ GAME OVER ✨",
+    "🏆 GAME OVER 🏆"
+)
+
+# Seconds each win announcement frame stays up; three frames keep the whole flash under 200ms
+WIN_FRAME_DELAY = 0.06
 
 
 class GameUI:
@@ -17,23 +44,33 @@ class GameUI:
     Handles all UI-related functionality for the Tic-Tac-Toe game.
     """
 
-    def __init__(self):
-        """Initialize the game UI with a console."""
+    # A move typed as "row,col", with optional spaces around either number
+    _MOVE_RE = re.compile(r"\s*(\d+)\s*,\s*(\d+)\s*$")
+
+    def __init__(self, animations: bool = True):
+        """
+        Initialize the game UI with a console.
+
+        Args:
+            animations (bool): Play the welcome, move and result animations;
+                when False every screen is rendered once without delays
+        """
         self.console = Console()
+        self.animations = animations
 
-    def clear_screen(self) -> None:
-        """Clear the console screen for a clean display."""
-        # For Windows
-        if os.name == 'nt':
-            os.system('cls')
-        # For Mac and Linux
-        else:
-            os.system('clear')
+        # Last rendered Text of each board row with the cells it was built from,
+        # and the board header and borders by board width
+        self._row_cache: Dict[int, Tuple[Tuple[str, ...], Text]] = {}
+        self._frame_cache: Dict[int, Tuple[Text, Text, Text]] = {}
 
-    def display_welcome(self) -> None:
-        """Display an animated, stylish welcome message inspired by Claude Code."""
-        self.clear_screen()
+        self._build_static_panels()
+
+    def _build_static_panels(self) -> None:
+        """
+        Build the panels that never change.
 
+        Every screen reprints these objects instead of rebuilding them on each call.
+        """
         # ASCII art for "TIC TAC TOE"
         title_art = """
         ████████╗██╗ ██████╗    ████████╗ █████╗  ██████╗    ████████╗ ██████╗ ███████╗
@@ -49,46 +86,39 @@ class GameUI:
         welcome_text.append("ATic-Tac-Toe", style="bold color(2)")
         welcome_text.append(" preview! ✨", style="dim white")
 
-        welcome_panel = Panel(
+        self._welcome_panel = Panel(
             welcome_text,
             box=box.ROUNDED,
             border_style="color(2)",
             padding=(1, 2)
         )
 
-        # Display welcome banner first without animation
-        self.console.print(welcome_panel)
-
         # Create main title panel
-        title_panel = Panel(
+        self._title_panel = Panel(
             Text(title_art, style="color(2)"),
             box=box.HEAVY,
             border_style="color(2)",
             padding=(1, 1)
         )
-        self.console.print(title_panel)
 
         # Subtitle with alpha-beta description
-        subtitle = Panel(
+        self._subtitle_panel = Panel(
             Text("9×9 with Heuristic Alpha-Beta Search", style="bold color(214)"),
             box=box.ROUNDED,
             border_style="color(214)"
         )
-        self.console.print(subtitle)
 
         # Author information
         author_text = Text("Created by: ", style="dim white")
         author_text.append("Le Dang Nguyen - 522K0020", style="bold color(250)")
-        author_panel = Panel(
+        self._author_panel = Panel(
             author_text,
             box=box.SIMPLE,
             border_style="bright_blue",
             width=50
         )
-        self.console.print(author_panel)
 
-        # Game rules with animated display
-        self.console.print()
+        # Game rules, one line each
         rules = [
             ("Game Rules:", "bold green"),
             ("• You are [bold red]X[/bold red], and the computer is [bold blue]O[/bold blue]", ""),
@@ -96,129 +126,297 @@ class GameUI:
             ("• Enter moves as [bold cyan]row,column[/bold cyan] (e.g., '3,4')", ""),
             ("• Both row and column should be between 1 and 9", "")
         ]
+        # Rendered like console.print(str), so Rich still highlights numbers, quotes and brackets
+        self._rules = Group(*(Styled(self.console.render_str(rule), style) for rule, style in rules))
+
+        # Bordered prompt for the human's move
+        self._move_prompt_panel = Panel(
+            Text.assemble(
+                ("Enter your move ", "white"),
+                ("(row,col)", "bold yellow"),
+                (" [1-9,1-9]: ", "white")
+            ),
+            box=box.ROUNDED,
+            border_style="yellow",
+            padding=(0, 2)
+        )
+
+        # Turn status headers, win announcement frames and the draw result
+        self._status_panels = {symbol: self._build_status_panel(symbol) for symbol in (PLAYER_X, PLAYER_O)}
+        self._win_panels = {
+            is_human_win: tuple(self._build_win_panel(is_human_win, frame) for frame in WIN_FRAMES)
+            for is_human_win in (True, False)
+        }
+        self._draw_panel = Panel(
+            Text("It's a draw! Well played by both sides.", style="bold yellow"),
+            box=box.HEAVY,
+            border_style="yellow",
+            title="Draw",
+            padding=(1, 2)
+        )
+
+    def clear_screen(self) -> None:
+        """
+        Clear the console screen for a clean display.
+
+        Sends the "erase display" and "cursor home" controls through the Rich
+        console instead of spawning a 'cls'/'clear' shell process on every
+        redraw. Rich leaves the controls out when output is not a terminal,
+        so redirected output stays free of escape codes. Only legacy Windows
+        consoles without ANSI support still fall back to 'cls'.
+        """
+        if self.console.legacy_windows:
+            os.system('cls')
+            return
+        self.console.control(Control.clear(), Control.home())
+
+    def display_welcome(self) -> None:
+        """Display an animated, stylish welcome message inspired by Claude Code."""
+        self.clear_screen()
 
-        for rule, style in rules:
-            self.console.print(rule, style=style)
-            time.sleep(0.1)
+        # Banner, title, subtitle and author panels are built once in _build_static_panels
+        self.console.print(self._welcome_panel)
+        self.console.print(self._title_panel)
+        self.console.print(self._subtitle_panel)
+        self.console.print(self._author_panel)
 
-        # Simpler animated prompt without ANSI sequences
+        # Game rules, revealed one line at a time when animating on a terminal
         self.console.print()
+        if self.animations and self.console.is_terminal:
+            lines = self._rules.renderables
+            with Live(Group(lines[0]), console=self.console, auto_refresh=False) as live:
+                for count in range(1, len(lines) + 1):
+                    live.update(Group(*lines[:count]), refresh=True)
+                    time.sleep(0.1)
+        else:
+            self.console.print(self._rules)
+
+        # Animated prompt; only the prompt line is redrawn, the screen above stays as printed
+        self.console.print()
+
+        if not self.animations:
+            self.console.print("Press [bold green]Enter[/bold green] to start the game...", style="bold")
+            input()
+            return
 
         prompt_styles = [
             "bold green",
             "bold yellow",
             "bold green"
         ]
+        # render_str runs the same markup and highlighting as console.print(str), so the
+        # frames match the prompt printed with --fast
+        prompts = [
+            Styled(self.console.render_str(f"Press [bold {style}]Enter[/bold {style}] to start the game..."), "bold")
+            for style in prompt_styles
+        ]
 
-        for style in prompt_styles:
-            self.clear_screen()
-            # Reprint all the content
-            self.console.print(welcome_panel)
-            self.console.print(title_panel)
-            self.console.print(subtitle)
-            self.console.print(author_panel)
-            self.console.print()
-
-            # Reprint all rules
-            for rule, rule_style in rules:
-                self.console.print(rule, style=rule_style)
-
-            self.console.print()
-            self.console.print(f"Press [bold {style}]Enter[/bold {style}] to start the game...", style="bold")
-            time.sleep(0.5)
-
-        # Final prompt
-        self.console.print("Press [bold green]Enter[/bold green] to start the game...", style="bold")
+        # The last prompt stays on screen while waiting for Enter
+        with Live(prompts[0], console=self.console, auto_refresh=False) as live:
+            for prompt in prompts:
+                live.update(prompt, refresh=True)
+                time.sleep(0.5)
         input()
 
-    def display_game_status(self, current_player_symbol: str) -> None:
+    @staticmethod
+    def _build_status_panel(current_player_symbol: str) -> Panel:
         """
-        Display game status header with clean styling.
+        Build the game status header with clean styling.
 
         Args:
             current_player_symbol (str): Symbol ('X' or 'O') of the current player
+
+        Returns:
+            Panel: Header with the game title and the player to move
         """
         # Create a clean header with game title and player turn
-        header = Panel(
+        return Panel(
             Text.assemble(
                 ("9×9 Tic-Tac-Toe", "bold cyan"),
                 (" | ", "dim white"),
                 ("Player's turn: ", "white"),
-                (current_player_symbol, f"bold white on {'red' if current_player_symbol == 'X' else 'blue'}")
+                (current_player_symbol, f"bold white on {'red' if current_player_symbol == PLAYER_X else 'blue'}")
             ),
             box=box.ROUNDED,
             border_style="blue",
             padding=(0, 2)
         )
 
-        self.console.print(header)
+    def render_game_status(self, current_player_symbol: str) -> Panel:
+        """
+        Return the game status header for the current player.
 
-    def display_board(self, board, last_move: Optional[Tuple[int, int]] = None) -> None:
+        Args:
+            current_player_symbol (str): Symbol ('X' or 'O') of the current player
+
+        Returns:
+            Panel: Prebuilt header with the game title and the player to move
         """
-        Display the game board with enhanced visuals.
+        return self._status_panels[current_player_symbol]
+
+    def display_game_status(self, current_player_symbol: str) -> None:
+        """
+        Display game status header with clean styling.
 
         Args:
+            current_player_symbol (str): Symbol ('X' or 'O') of the current player
+        """
+        self.console.print(self.render_game_status(current_player_symbol))
+
+    def display_turn(self, current_player_symbol: str, board,
+                     last_move: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Clear the screen and display the status header and the board for the start of a turn.
+
+        The clear sequence, header and board are collected in the console's
+        buffer and written to the terminal together, so each turn redraws the
+        screen with a single write.
+
+        Args:
+            current_player_symbol (str): Symbol ('X' or 'O') of the current player
             board: 2D list representing the board state
             last_move: Optional tuple with (row, col) of the last move made
         """
-        # Define better cell visuals
-        light_bg = "grey23"
-        dark_bg = "grey15"
+        turn_screen = Group(
+            self.render_game_status(current_player_symbol),
+            self.render_board(board, last_move)
+        )
+
+        if self.console.legacy_windows:
+            self.clear_screen()
+            self.console.print(turn_screen)
+            return
+
+        # Nested output stays in the buffer until the outermost block exits
+        with self.console:
+            self.console.control(Control.clear(), Control.home())
+            self.console.print(turn_screen)
+
+    def _render_board_frame(self, width: int) -> Tuple[Text, Text, Text]:
+        """
+        Return the column header and the top and bottom borders of the board.
 
-        # Column numbers with consistent styling
-        cols = Text("     ")
-        for i in range(len(board[0])):
-            cols.append(f" {i + 1} ", style="bold cyan")
-        self.console.print(cols)
+        They only depend on the board width, so they are built once.
 
-        # Top border
-        border = Text("    ┏")
-        border.append("━━━" * len(board[0]), style="cyan")
-        border.append("┓")
-        self.console.print(border)
+        Args:
+            width (int): Number of columns on the board
+
+        Returns:
+            tuple: (column header, top border, bottom border)
+        """
+        frame = self._frame_cache.get(width)
+        if frame is None:
+            # Column numbers with consistent styling
+            cols = Text("     ")
+            for i in range(width):
+                cols.append(f" {i + 1} ", style="bold cyan")
+
+            # Top border
+            top = Text("    ┏")
+            top.append("━━━" * width, style="cyan")
+            top.append("┓")
+
+            # Bottom border
+            bottom = Text("    ┗")
+            bottom.append("━━━" * width, style="cyan")
+            bottom.append("┛")
+
+            frame = self._frame_cache[width] = (cols, top, bottom)
+        return frame
+
+    @staticmethod
+    def _render_board_row(i: int, board_row, highlight_col: Optional[int] = None,
+                          highlight_style: str = HIGHLIGHT_STYLE) -> Text:
+        """
+        Build one bordered row of the board.
+
+        Args:
+            i (int): Row index (0-8)
+            board_row: Cell symbols of the row
+            highlight_col: Column of the last move if it is in this row
+            highlight_style: Rich style used for the last move's cell
+
+        Returns:
+            Text: Row number, styled cells and right border
+        """
+        # Row number
+        row = Text(f" {i + 1}  ┃", style="bold cyan")
+
+        for j, cell in enumerate(board_row):
+            # Cell styling
+            if j == highlight_col:
+                # Highlighted last move
+                cell_style = highlight_style
+            elif cell == PLAYER_X:
+                cell_style = X_CELL_STYLE
+            elif cell == PLAYER_O:
+                cell_style = O_CELL_STYLE
+            else:
+                cell_style = EMPTY_CELL_STYLES[(i ^ j) & 1]
+
+            # Cell content
+            if cell == EMPTY:
+                cell_content = EMPTY_CELL
+            else:
+                cell_content = f" {cell} "
+
+            row.append(cell_content, style=cell_style)
+
+        # Right border
+        row.append("┃")
+        return row
+
+    def render_board(self, board, last_move: Optional[Tuple[int, int]] = None,
+                     highlight_style: str = HIGHLIGHT_STYLE) -> Group:
+        """
+        Build the game board with enhanced visuals as a single renderable.
+
+        Only one cell changes between turns, so rows without the highlighted
+        last move are reused from the previous render when their cells match.
+
+        Args:
+            board: 2D list representing the board state
+            last_move: Optional tuple with (row, col) of the last move made
+            highlight_style: Rich style used for the last move's cell
+
+        Returns:
+            Group: Column header, bordered rows and bottom border of the board
+        """
+        cols, top, bottom = self._render_board_frame(len(board[0]))
+        lines = [cols, top]
 
         # Board cells
-        for i in range(len(board)):
-            # Row number
-            row = Text(f" {i + 1}  ┃", style="bold cyan")
-
-            for j in range(len(board[i])):
-                cell = board[i][j]
-                bg_color = light_bg if (i + j) % 2 == 0 else dark_bg
-
-                # Cell styling
-                if last_move and i == last_move[0] and j == last_move[1]:
-                    # Highlighted last move
-                    cell_style = f"bold white on green"
-                elif cell == 'X':
-                    cell_style = f"bold white on red"
-                elif cell == 'O':
-                    cell_style = f"bold white on blue"
-                else:
-                    cell_style = f"dim white on {bg_color}"
-
-                # Cell content
-                if cell == ' ':
-                    cell_content = " · "
-                else:
-                    cell_content = f" {cell} "
-
-                row.append(cell_content, style=cell_style)
-
-            # Right border
-            row.append("┃")
-            self.console.print(row)
-
-        # Bottom border
-        border = Text("    ┗")
-        border.append("━━━" * len(board[0]), style="cyan")
-        border.append("┛")
-        self.console.print(border)
+        for i, board_row in enumerate(board):
+            if last_move and i == last_move[0]:
+                lines.append(self._render_board_row(i, board_row, last_move[1], highlight_style))
+                continue
+
+            cells = tuple(board_row)
+            cached = self._row_cache.get(i)
+            if cached is None or cached[0] != cells:
+                cached = self._row_cache[i] = (cells, self._render_board_row(i, cells))
+            lines.append(cached[1])
+
+        lines.append(bottom)
+        return Group(*lines)
+
+    def display_board(self, board, last_move: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Display the game board with enhanced visuals.
+
+        Args:
+            board: 2D list representing the board state
+            last_move: Optional tuple with (row, col) of the last move made
+        """
+        self.console.print(self.render_board(board, last_move))
 
     def animate_move(self, board, row: int, col: int, symbol: str) -> None:
         """
         Create a simple animation effect for a new move.
 
+        The board is drawn once and each frame only updates it in place, so the
+        flash does not clear and reprint the whole screen per frame.
+
         Args:
             board: The game board
             row (int): Row index of the move
@@ -232,15 +430,15 @@ class GameUI:
             "bold white on green"
         ]
 
-        # Save the original cell value
-        original_cell = board[row][col]
+        if not self.animations:
+            return
 
-        # Clear screen between animation frames
-        for style in highlight_styles:
-            self.clear_screen()
-            # Create a temporary last_move for highlighting
-            self.display_board(board, (row, col))
-            time.sleep(0.2)
+        self.clear_screen()
+        with Live(self.render_board(board, (row, col), highlight_styles[0]),
+                  console=self.console, auto_refresh=False) as live:
+            for style in highlight_styles:
+                live.update(self.render_board(board, (row, col), style), refresh=True)
+                time.sleep(0.2)
 
     def prompt_for_move(self) -> Tuple[int, int]:
         """
@@ -250,54 +448,37 @@ class GameUI:
             tuple: (row, col) of the user's move (0-indexed)
         """
         while True:
-            try:
-                # Simple bordered prompt without cursor repositioning
-                prompt_panel = Panel(
-                    Text.assemble(
-                        ("Enter your move ", "white"),
-                        ("(row,col)", "bold yellow"),
-                        (" [1-9,1-9]: ", "white")
-                    ),
-                    box=box.ROUNDED,
-                    border_style="yellow",
-                    padding=(0, 2)
-                )
-
-                self.console.print(prompt_panel)
-
-                # Get input on a new line (no cursor positioning)
-                move = input()
-
-                # Process input
-                row, col = map(int, move.split(','))
-                # Adjust to 0-indexed
-                row -= 1
-                col -= 1
-
-                if 0 <= row < 9 and 0 <= col < 9:
-                    return row, col
-                else:
-                    self.console.print("⚠️  Invalid position. Row and column must be between 1 and 9.",
-                                       style="bold red")
-            except ValueError:
+            # Simple bordered prompt without cursor repositioning
+            self.console.print(self._move_prompt_panel)
+
+            # Get input on a new line (no cursor positioning)
+            match = self._MOVE_RE.match(input())
+            if match is None:
                 self.console.print("⚠️  Invalid input. Enter as 'row,col' (e.g., '3,4').",
                                    style="bold red")
+                continue
 
-    def display_win_announcement(self, is_human_win: bool, board) -> None:
+            # Adjust to 0-indexed
+            row = int(match.group(1)) - 1
+            col = int(match.group(2)) - 1
+
+            if 0 <= row < 9 and 0 <= col < 9:
+                return row, col
+            self.console.print("⚠️  Invalid position. Row and column must be between 1 and 9.",
+                               style="bold red")
+
+    @staticmethod
+    def _build_win_panel(is_human_win: bool, frame: str) -> Panel:
         """
-        Display a stylized win announcement.
+        Build one frame of the win announcement.
 
         Args:
             is_human_win (bool): True if human won, False if computer won
-            board: The current board state to display
-        """
-        # Animation frames for the win announcement
-        frames = [
-            "🎮 GAME OVER 🎮",
-            "✨ GAME OVER ✨",
-            "🏆 GAME OVER 🏆"
-        ]
+            frame (str): Title line shown in this frame
 
+        Returns:
+            Panel: Result panel with the frame title and the win message
+        """
         # Win message based on winner
         if is_human_win:
             win_text = "🎉 Congratulations! You Won! 🎉"
@@ -308,32 +489,41 @@ class GameUI:
             style = "bold red"
             border_style = "red"
 
-        # Animate the announcement
-        for i in range(6):  # Animation loop
-            self.clear_screen()
-            self.display_board(board)
+        return Panel(
+            Group(
+                Align.center(Text(frame, style=style)),
+                Align.center(Text(win_text, style=style))
+            ),
+            box=box.HEAVY,
+            border_style=border_style,
+            title="Result",
+            padding=(1, 2)
+        )
 
-            frame_idx = i % len(frames)
+    def display_win_announcement(self, is_human_win: bool, board) -> None:
+        """
+        Display a stylized win announcement.
 
-            # Create title with current frame
-            title_text = Text(frames[frame_idx], style=style)
+        Args:
+            is_human_win (bool): True if human won, False if computer won
+            board: The current board state to display
+        """
+        panels = self._win_panels[is_human_win]
 
-            # Create the result panel
-            result_panel = Panel(
-                Group(
-                    Align.center(title_text),
-                    Align.center(Text(win_text, style=style))
-                ),
-                box=box.HEAVY,
-                border_style=border_style,
-                title="Result",
-                padding=(1, 2)
-            )
+        # The board is drawn once; only the result panel changes between frames
+        self.clear_screen()
+        self.display_board(board)
+        self.console.print()
 
-            self.console.print()
-            self.console.print(result_panel)
+        if not self.animations:
+            self.console.print(panels[-1])
+            return
 
-            time.sleep(0.3)
+        # Cycle the frames in place, ending on the last one
+        with Live(panels[0], console=self.console, auto_refresh=False) as live:
+            for panel in panels:
+                live.update(panel, refresh=True)
+                time.sleep(WIN_FRAME_DELAY)
 
     def display_draw_announcement(self, board) -> None:
         """
@@ -345,24 +535,27 @@ class GameUI:
         self.clear_screen()
         self.display_board(board)
 
-        # Create the draw panel
-        draw_panel = Panel(
-            Text("It's a draw! Well played by both sides.", style="bold yellow"),
-            box=box.HEAVY,
-            border_style="yellow",
-            title="Draw",
-            padding=(1, 2)
-        )
-
         self.console.print()
-        self.console.print(draw_panel)
+        self.console.print(self._draw_panel)
+
+    @contextmanager
+    def display_computer_thinking(self) -> Iterator[None]:
+        """
+        Show an animated 'computer thinking' spinner around the AI search.
 
-    def display_computer_thinking(self) -> None:
-        """Display an animated 'computer thinking' message."""
+        The spinner runs on Rich's own thread while the search works. A search
+        that ends sooner than MIN_THINKING_TIME is padded with the remainder
+        only, so the spinner does not flicker past; longer searches are never
+        delayed. The padding is skipped when animations are off.
+        """
+        start = time.perf_counter()
         thinking_text = Text("Computer is thinking", style="bold blue")
-        with self.console.status(thinking_text, spinner="dots") as status:
-            # Simulate "thinking" time - this will be handled by the controller
-            time.sleep(1.5)
+        with self.console.status(thinking_text, spinner="dots"):
+            yield
+            if self.animations:
+                remaining = MIN_THINKING_TIME - (time.perf_counter() - start)
+                if remaining > 0:
+                    time.sleep(remaining)
 
     def display_computer_move(self, row: int, col: int) -> None:
         """